@@ -10,11 +10,17 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import utility functions
 from src.utils import (
+    DERIVED_COLUMNS,
     load_pricing_data, 
     calculate_cost, 
     calculate_total_cost,
     filter_pricing_data, 
+    cached_filter_pricing_data,
+    get_filter_options,
+    get_units_by,
     compare_providers,
+    get_cheapest_services,
+    get_regional_variance,
     get_performance_ratio,
     apply_reserved_discount
 )
@@ -25,7 +31,8 @@ from src.visualizations import (
     plot_price_performance_ratio,
     plot_regional_pricing,
     plot_reserved_savings,
-    plot_cost_breakdown
+    plot_cost_breakdown,
+    highlight_min
 )
 
 # Page configuration
@@ -77,6 +84,221 @@ This simulator helps organizations compare and model cloud pricing across differ
 Evaluate cost structures, compare performance metrics, and find the most cost-effective solution for your workloads.
 """)
 
+@st.fragment
+def render_price_comparison(
+    filtered_df: pd.DataFrame,
+    selected_service_type: str,
+    selected_region: str
+) -> None:
+    """
+    Render the Price Comparison tab.
+    
+    Runs as a fragment so changing its usage parameters only reruns this tab.
+    
+    Args:
+        filtered_df: Pricing data filtered by the sidebar selections
+        selected_service_type: Service type selected in the sidebar
+        selected_region: Region selected in the sidebar
+    """
+    st.header("Price Comparison")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col2:
+        st.subheader("Usage Parameters")
+        usage_amount = st.number_input(
+            "Usage Amount", 
+            min_value=0.1, 
+            value=100.0, 
+            step=10.0,
+            help="Amount of resources to use in the calculation"
+        )
+        
+        # Determine the unit based on selected service
+        if selected_service_type != "All" and not filtered_df.empty:
+            # Every filtered row has the selected service type, so the first row's unit applies
+            service_unit = filtered_df['Units'].iat[0]
+            st.write(f"Unit: {service_unit}")
+        
+        include_reserved = st.checkbox("Include Reserved Instance Pricing", value=True)
+        
+    with col1:
+        if not filtered_df.empty:
+            # Generate comparison data
+            comparison_df = compare_providers(
+                filtered_df,
+                selected_service_type if selected_service_type != "All" else filtered_df['Usage Type'].iat[0],
+                usage_amount,
+                selected_region if selected_region != "All" else None
+            )
+            
+            if not comparison_df.empty:
+                # Visualization
+                cost_fig = plot_cost_comparison(comparison_df)
+                if cost_fig:
+                    st.plotly_chart(cost_fig, use_container_width=True)
+                
+                # If reserved pricing should be included
+                if include_reserved:
+                    reserved_fig = plot_reserved_savings(comparison_df)
+                    if reserved_fig:
+                        st.plotly_chart(reserved_fig, use_container_width=True)
+                
+                # Raw data in a table
+                st.subheader("Detailed Pricing Data")
+                st.dataframe(highlight_min(comparison_df.drop(columns='Provider_Service', errors='ignore'), 'On-Demand Cost'))
+            else:
+                st.info("No matching services found with the current filters. Please adjust your selections.")
+        else:
+            st.info("Please select a service type and region to compare prices.")
+
+
+@st.fragment
+def render_cost_simulator(
+    pricing_df: pd.DataFrame,
+    filtered_df: pd.DataFrame,
+    selected_region: str,
+    selected_provider: str
+) -> None:
+    """
+    Render the Cost Simulator tab.
+    
+    Runs as a fragment so configuring and calculating a scenario only reruns this tab.
+    
+    Args:
+        pricing_df: Full pricing data
+        filtered_df: Pricing data filtered by the sidebar selections
+        selected_region: Region selected in the sidebar
+        selected_provider: Cloud provider selected in the sidebar
+    """
+    st.header("Cost Simulator")
+    
+    st.write("Simulate costs for different scenarios and workloads.")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col2:
+        st.subheader("Simulator Settings")
+        
+        # Service selection
+        units_by_service = get_units_by(pricing_df, 'Service')
+        service_options = list(units_by_service)
+        selected_services = st.multiselect(
+            "Select Services to Include",
+            options=service_options,
+            default=service_options[0:2] if len(service_options) > 1 else service_options
+        )
+        
+        # Time period selection
+        time_period = st.selectbox(
+            "Billing Period",
+            options=["month", "day", "year"],
+            index=0
+        )
+        
+        # Reserved instance option
+        reservation_type = st.selectbox(
+            "Pricing Model",
+            options=["on-demand", "1yr", "3yr"],
+            index=0
+        )
+        
+    with col1:
+        if selected_services:
+            st.subheader("Usage Configuration")
+            
+            # Create usage inputs for each selected service
+            usage_values = {}
+            for service in selected_services:
+                if service in units_by_service:
+                    service_unit = units_by_service[service]
+                    default_value = 100.0 if 'GB' in service_unit else 730.0 if 'Hour' in service_unit else 10.0
+                    
+                    usage_values[service] = st.number_input(
+                        f"{service} ({service_unit})",
+                        min_value=0.0,
+                        value=default_value,
+                        step=10.0,
+                        key=f"usage_{service}"
+                    )
+            
+            # Calculate button
+            if st.button("Calculate Total Cost", key="calc_total"):
+                # Find the lowest cost option for each selected service
+                cheapest_df = get_cheapest_services(
+                    filtered_df, 
+                    usage_values, 
+                    time_period, 
+                    reservation_type
+                )
+                
+                service_costs = [
+                    {
+                        'name': f"{provider} {service}",
+                        'cost': cost,
+                        'currency': service_currency
+                    }
+                    for provider, service, cost, service_currency in zip(
+                        cheapest_df['Provider'],
+                        cheapest_df['Service'],
+                        cheapest_df['Final Cost'],
+                        cheapest_df['Currency']
+                    )
+                ]
+                total_cost = float(cheapest_df['Final Cost'].sum())
+                currency = service_costs[-1]['currency'] if service_costs else ""
+                
+                # Display results
+                if service_costs:
+                    st.subheader("Estimated Costs")
+                    
+                    # Total cost metrics
+                    st.metric(
+                        label=f"Total Estimated Cost ({currency}/{time_period})",
+                        value=f"{currency} {total_cost:.2f}"
+                    )
+                    
+                    # Cost breakdown
+                    cost_breakdown_cols = st.columns(len(service_costs))
+                    for i, cost_item in enumerate(service_costs):
+                        with cost_breakdown_cols[i]:
+                            st.metric(
+                                label=cost_item['name'],
+                                value=f"{cost_item['currency']} {cost_item['cost']:.2f}"
+                            )
+                    
+                    # Cost breakdown chart
+                    breakdown_fig = plot_cost_breakdown(service_costs)
+                    if breakdown_fig:
+                        st.plotly_chart(breakdown_fig, use_container_width=True)
+                    
+                    # Cost optimization suggestions
+                    st.subheader("Cost Optimization Suggestions")
+                    
+                    # Generate some suggestions based on the data
+                    suggestions = []
+                    
+                    # Check if reserved instances would save money
+                    if reservation_type == "on-demand":
+                        suggestions.append("Consider using reserved instances for significant savings on predictable workloads.")
+                    
+                    # Check for cheaper regions
+                    if selected_region != "All":
+                        suggestions.append("Evaluate using different regions, as pricing can vary significantly by location.")
+                    
+                    # Check for alternative providers
+                    if selected_provider != "All":
+                        suggestions.append("Compare pricing across multiple cloud providers to find the best value.")
+                    
+                    # Display suggestions
+                    for i, suggestion in enumerate(suggestions):
+                        st.write(f"{i+1}. {suggestion}")
+                else:
+                    st.warning("Could not calculate costs with the current selections.")
+        else:
+            st.info("Please select at least one service to simulate costs.")
+
+
 # Create tabs for different features
 tab1, tab2, tab3, tab4 = st.tabs(["Price Comparison", "Performance Analysis", "Regional Pricing", "Cost Simulator"])
 
@@ -87,18 +309,17 @@ if pricing_df is not None:
     # Sidebar filters that apply across all tabs
     st.sidebar.markdown('<div class="sidebar-header">Filter Options</div>', unsafe_allow_html=True)
     
-    providers = ["All"] + sorted(pricing_df['Provider'].unique().tolist())
-    services = ["All"] + sorted(pricing_df['Usage Type'].unique().tolist())
-    regions = ["All"] + sorted(pricing_df['Region'].unique().tolist())
+    providers = get_filter_options(pricing_df, 'Provider')
+    services = get_filter_options(pricing_df, 'Usage Type')
+    regions = get_filter_options(pricing_df, 'Region')
     
     selected_provider = st.sidebar.selectbox("Cloud Provider", providers)
     selected_service_type = st.sidebar.selectbox("Service Type", services)
     selected_region = st.sidebar.selectbox("Region", regions)
     
     # Apply filters
-    filtered_df = pricing_df.copy()
-    filtered_df = filter_pricing_data(
-        filtered_df, 
+    filtered_df = cached_filter_pricing_data(
+        pricing_df, 
         provider=selected_provider, 
         usage_type=selected_service_type, 
         region=selected_region
@@ -106,56 +327,7 @@ if pricing_df is not None:
     
     # Tab 1: Price Comparison
     with tab1:
-        st.header("Price Comparison")
-        
-        col1, col2 = st.columns([3, 1])
-        
-        with col2:
-            st.subheader("Usage Parameters")
-            usage_amount = st.number_input(
-                "Usage Amount", 
-                min_value=0.1, 
-                value=100.0, 
-                step=10.0,
-                help="Amount of resources to use in the calculation"
-            )
-            
-            # Determine the unit based on selected service
-            if selected_service_type != "All" and not filtered_df.empty:
-                service_unit = filtered_df[filtered_df['Usage Type'] == selected_service_type]['Units'].iloc[0]
-                st.write(f"Unit: {service_unit}")
-            
-            include_reserved = st.checkbox("Include Reserved Instance Pricing", value=True)
-            
-        with col1:
-            if not filtered_df.empty:
-                # Generate comparison data
-                comparison_df = compare_providers(
-                    filtered_df,
-                    selected_service_type if selected_service_type != "All" else filtered_df['Usage Type'].iloc[0],
-                    usage_amount,
-                    selected_region if selected_region != "All" else None
-                )
-                
-                if not comparison_df.empty:
-                    # Visualization
-                    cost_fig = plot_cost_comparison(comparison_df)
-                    if cost_fig:
-                        st.plotly_chart(cost_fig, use_container_width=True)
-                    
-                    # If reserved pricing should be included
-                    if include_reserved:
-                        reserved_fig = plot_reserved_savings(comparison_df)
-                        if reserved_fig:
-                            st.plotly_chart(reserved_fig, use_container_width=True)
-                    
-                    # Raw data in a table
-                    st.subheader("Detailed Pricing Data")
-                    st.dataframe(comparison_df.style.highlight_min(subset=['On-Demand Cost'], color='lightgreen'))
-                else:
-                    st.info("No matching services found with the current filters. Please adjust your selections.")
-            else:
-                st.info("Please select a service type and region to compare prices.")
+        render_price_comparison(filtered_df, selected_service_type, selected_region)
     
     # Tab 2: Performance Analysis
     with tab2:
@@ -191,7 +363,7 @@ if pricing_df is not None:
                     
                     # Display performance data table
                     st.subheader("Price-Performance Details")
-                    st.dataframe(performance_df.sort_values('Price/Performance Ratio').style.highlight_min(subset=['Price/Performance Ratio'], color='lightgreen'))
+                    st.dataframe(highlight_min(performance_df, 'Price/Performance Ratio'))
                 else:
                     st.info("No performance data available with the current filters.")
             else:
@@ -207,7 +379,7 @@ if pricing_df is not None:
             st.subheader("Regional Filter")
             regional_service = st.selectbox(
                 "Service Type for Regional Analysis",
-                options=["All"] + sorted(pricing_df['Usage Type'].unique().tolist()),
+                options=services,
                 key="regional_service"
             )
             
@@ -221,8 +393,7 @@ if pricing_df is not None:
                     st.plotly_chart(region_fig, use_container_width=True)
                     
                     # Filter data for this specific service type
-                    regional_data = pricing_df[pricing_df['Usage Type'] == regional_service].copy()
-                    regional_data = regional_data.sort_values(['Provider', 'Region'])
+                    regional_data = get_regional_variance(pricing_df, regional_service)
                     
                     # Display regional data table
                     st.subheader("Regional Pricing Details")
@@ -231,14 +402,9 @@ if pricing_df is not None:
                     # Show percentage difference from cheapest region
                     st.subheader("Regional Price Variance")
                     
-                    for provider in regional_data['Provider'].unique():
-                        provider_data = regional_data[regional_data['Provider'] == provider].copy()
-                        if not provider_data.empty:
-                            min_price = provider_data['Price Per Unit'].min()
-                            provider_data['% Above Lowest'] = ((provider_data['Price Per Unit'] - min_price) / min_price * 100).round(2)
-                            
-                            st.write(f"**{provider}** price variance:")
-                            st.dataframe(provider_data[['Region', 'Price Per Unit', '% Above Lowest']].sort_values('Price Per Unit'))
+                    for provider, provider_data in regional_data.groupby('Provider', observed=True):
+                        st.write(f"**{provider}** price variance:")
+                        st.dataframe(provider_data[['Region', 'Price Per Unit', '% Above Lowest']].sort_values('Price Per Unit'))
                 else:
                     st.info("Insufficient regional pricing data for the selected service type.")
             else:
@@ -246,155 +412,12 @@ if pricing_df is not None:
     
     # Tab 4: Cost Simulator
     with tab4:
-        st.header("Cost Simulator")
-        
-        st.write("Simulate costs for different scenarios and workloads.")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col2:
-            st.subheader("Simulator Settings")
-            
-            # Service selection
-            selected_services = st.multiselect(
-                "Select Services to Include",
-                options=pricing_df['Service'].unique().tolist(),
-                default=pricing_df['Service'].unique().tolist()[0:2] if len(pricing_df['Service'].unique()) > 1 else pricing_df['Service'].unique().tolist()
-            )
-            
-            # Time period selection
-            time_period = st.selectbox(
-                "Billing Period",
-                options=["month", "day", "year"],
-                index=0
-            )
-            
-            # Reserved instance option
-            reservation_type = st.selectbox(
-                "Pricing Model",
-                options=["on-demand", "1yr", "3yr"],
-                index=0
-            )
-            
-        with col1:
-            if selected_services:
-                st.subheader("Usage Configuration")
-                
-                # Create usage inputs for each selected service
-                usage_values = {}
-                for service in selected_services:
-                    service_rows = pricing_df[pricing_df['Service'] == service]
-                    
-                    if not service_rows.empty:
-                        service_unit = service_rows['Units'].iloc[0]
-                        default_value = 100.0 if 'GB' in service_unit else 730.0 if 'Hour' in service_unit else 10.0
-                        
-                        usage_values[service] = st.number_input(
-                            f"{service} ({service_unit})",
-                            min_value=0.0,
-                            value=default_value,
-                            step=10.0,
-                            key=f"usage_{service}"
-                        )
-                
-                # Calculate button
-                if st.button("Calculate Total Cost", key="calc_total"):
-                    # Calculate costs for each selected service
-                    service_costs = []
-                    total_cost = 0.0
-                    currency = ""
-                    
-                    for service in selected_services:
-                        service_rows = filtered_df[filtered_df['Service'] == service]
-                        
-                        if not service_rows.empty:
-                            # Find the lowest cost option for this service
-                            min_cost_row = None
-                            min_cost = float('inf')
-                            
-                            for _, row in service_rows.iterrows():
-                                cost_info = calculate_total_cost(
-                                    row, 
-                                    usage_values[service], 
-                                    time_period, 
-                                    reservation_type
-                                )
-                                
-                                if cost_info['final_cost'] < min_cost:
-                                    min_cost = cost_info['final_cost']
-                                    min_cost_row = row
-                                    currency = cost_info['currency']
-                            
-                            if min_cost_row is not None:
-                                cost_info = calculate_total_cost(
-                                    min_cost_row, 
-                                    usage_values[service], 
-                                    time_period, 
-                                    reservation_type
-                                )
-                                
-                                service_costs.append({
-                                    'name': f"{min_cost_row['Provider']} {service}",
-                                    'cost': cost_info['final_cost'],
-                                    'currency': cost_info['currency']
-                                })
-                                
-                                total_cost += cost_info['final_cost']
-                    
-                    # Display results
-                    if service_costs:
-                        st.subheader("Estimated Costs")
-                        
-                        # Total cost metrics
-                        st.metric(
-                            label=f"Total Estimated Cost ({currency}/{time_period})",
-                            value=f"{currency} {total_cost:.2f}"
-                        )
-                        
-                        # Cost breakdown
-                        cost_breakdown_cols = st.columns(len(service_costs))
-                        for i, cost_item in enumerate(service_costs):
-                            with cost_breakdown_cols[i]:
-                                st.metric(
-                                    label=cost_item['name'],
-                                    value=f"{cost_item['currency']} {cost_item['cost']:.2f}"
-                                )
-                        
-                        # Cost breakdown chart
-                        breakdown_fig = plot_cost_breakdown(service_costs)
-                        if breakdown_fig:
-                            st.plotly_chart(breakdown_fig, use_container_width=True)
-                        
-                        # Cost optimization suggestions
-                        st.subheader("Cost Optimization Suggestions")
-                        
-                        # Generate some suggestions based on the data
-                        suggestions = []
-                        
-                        # Check if reserved instances would save money
-                        if reservation_type == "on-demand":
-                            suggestions.append("Consider using reserved instances for significant savings on predictable workloads.")
-                        
-                        # Check for cheaper regions
-                        if selected_region != "All":
-                            suggestions.append("Evaluate using different regions, as pricing can vary significantly by location.")
-                        
-                        # Check for alternative providers
-                        if selected_provider != "All":
-                            suggestions.append("Compare pricing across multiple cloud providers to find the best value.")
-                        
-                        # Display suggestions
-                        for i, suggestion in enumerate(suggestions):
-                            st.write(f"{i+1}. {suggestion}")
-                    else:
-                        st.warning("Could not calculate costs with the current selections.")
-            else:
-                st.info("Please select at least one service to simulate costs.")
+        render_cost_simulator(pricing_df, filtered_df, selected_region, selected_provider)
 
 # Display the raw data
 with st.expander("View Raw Pricing Data"):
     if pricing_df is not None:
-        st.dataframe(pricing_df)
+        st.dataframe(pricing_df.drop(columns=[c for c in DERIVED_COLUMNS if c in pricing_df.columns]))
     else:
         st.error("Failed to load pricing data.")
 
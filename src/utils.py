@@ -1,14 +1,24 @@
 import pandas as pd
 import os
 import numpy as np
+import streamlit as st
 from typing import Optional, Dict, List, Union, Tuple
 
+from src.utils_jit import calculate_costs, cheapest_per_group
+
+# Multipliers converting a monthly cost to each billing period
+_TIME_SCALE = {
+    'day': 1.0 / 30.0,  # Approximate daily cost
+    'month': 1.0,
+    'year': 12.0  # Annual cost
+}
+
 def load_pricing_data(file_path: Optional[str] = None) -> Optional[pd.DataFrame]:
     """
-    Load cloud service pricing data from a CSV file.
+    Load cloud service pricing data from a CSV or Parquet file.
     
     Args:
-        file_path: Path to the CSV file containing pricing data.
+        file_path: Path to the CSV or Parquet file containing pricing data.
                   If None, uses default sample data.
     
     Returns:
@@ -25,6 +35,13 @@ def load_pricing_data(file_path: Optional[str] = None) -> Optional[pd.DataFrame]
         ]
         
         for path in possible_paths:
+            # Prefer a Parquet copy unless the CSV has been edited since it was written
+            parquet_path = os.path.splitext(path)[0] + '.parquet'
+            if os.path.exists(parquet_path) and not (
+                os.path.exists(path) and os.path.getmtime(path) > os.path.getmtime(parquet_path)
+            ):
+                file_path = parquet_path
+                break
             if os.path.exists(path):
                 file_path = path
                 break
@@ -36,14 +53,59 @@ def load_pricing_data(file_path: Optional[str] = None) -> Optional[pd.DataFrame]
     
     try:
         absolute_path = os.path.abspath(file_path)
-        print(f"Loading pricing data from: {absolute_path}")
-        df = pd.read_csv(absolute_path)
-        return df
+        return _read_pricing_file(absolute_path, os.path.getmtime(absolute_path))
     except Exception as e:
         print(f"Error loading pricing data: {e}")
         print("Creating sample data instead.")
         return create_sample_pricing_data()
 
+@st.cache_data(show_spinner=False)
+def _read_pricing_file(absolute_path: str, modified_time: float) -> pd.DataFrame:
+    """
+    Read a pricing data file, cached across Streamlit reruns.
+    
+    Args:
+        absolute_path: Absolute path to the pricing data file
+        modified_time: File modification time, so edits to the file invalidate the cache
+    
+    Returns:
+        DataFrame containing the pricing data.
+    """
+    print(f"Loading pricing data from: {absolute_path}")
+    if absolute_path.endswith('.parquet'):
+        return _prepare_pricing_data(pd.read_parquet(absolute_path, engine='pyarrow'))
+    return _prepare_pricing_data(pd.read_csv(absolute_path))
+
+# Columns added by _prepare_pricing_data, hidden wherever the pricing data is shown as loaded
+DERIVED_COLUMNS = ('Provider_Service', 'Reserved Factor 1yr', 'Reserved Factor 3yr')
+
+def _prepare_pricing_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add derived columns used by the cost calculations.
+    
+    Args:
+        df: DataFrame with pricing data as read from disk
+    
+    Returns:
+        DataFrame with the derived columns added
+    """
+    # Store low-cardinality text columns as categoricals for cheaper filtering and grouping
+    for column in ('Provider', 'Service', 'Instance Type', 'Region', 'Usage Type', 'Units', 'Currency'):
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    
+    # Chart labels are built once here instead of on every render
+    df['Provider_Service'] = (df['Provider'].astype(str) + ' - ' + df['Service'].astype(str)).astype('category')
+    
+    # Precompute reserved pricing multipliers so costs are a single multiply
+    for term in ('1yr', '3yr'):
+        discount_column = f'Reserved Discount {term}'
+        if discount_column in df.columns:
+            df[f'Reserved Factor {term}'] = 1 - df[discount_column].fillna(0) / 100
+    
+    return df
+
+@st.cache_data(show_spinner=False)
 def create_sample_pricing_data() -> pd.DataFrame:
     """
     Create sample cloud pricing data.
@@ -76,12 +138,14 @@ def create_sample_pricing_data() -> pd.DataFrame:
     
     df = pd.DataFrame(data)
     
-    # Save the sample data to a file for future use
-    os.makedirs('data', exist_ok=True)
-    df.to_csv('data/cloud_storage_pricing.csv', index=False)
-    print("Sample data created and saved to data/cloud_storage_pricing.csv")
+    # Save the sample data to a file for future use, leaving any existing data file untouched
+    if not os.path.exists('data/cloud_storage_pricing.csv'):
+        os.makedirs('data', exist_ok=True)
+        df.to_csv('data/cloud_storage_pricing.csv', index=False)
+        df.to_parquet('data/cloud_storage_pricing.parquet', engine='pyarrow', compression='zstd', index=False)
+        print("Sample data created and saved to data/cloud_storage_pricing.csv and data/cloud_storage_pricing.parquet")
     
-    return df
+    return _prepare_pricing_data(df)
 
 def calculate_cost(
     usage: float, 
@@ -101,16 +165,8 @@ def calculate_cost(
     Returns:
         Total calculated cost
     """
-    # Base calculation
-    cost = float(usage) * float(price_per_unit)
-    
-    # Adjust for time period
-    if time_period == 'day':
-        cost = cost / 30  # Approximate daily cost
-    elif time_period == 'year':
-        cost = cost * 12  # Annual cost
-    
-    return cost
+    # Base calculation, adjusted for time period
+    return float(usage) * float(price_per_unit) * _TIME_SCALE.get(time_period, 1.0)
 
 def apply_reserved_discount(
     cost: float, 
@@ -128,6 +184,26 @@ def apply_reserved_discount(
     """
     return cost * (1 - discount_percentage / 100)
 
+def _reserved_factor(df: pd.DataFrame, reserved_instance: str) -> Optional[np.ndarray]:
+    """
+    Get the reserved pricing cost multiplier for each row.
+    
+    Args:
+        df: DataFrame with pricing data
+        reserved_instance: Type of instance pricing ('on-demand', '1yr', or '3yr')
+    
+    Returns:
+        Array of cost multipliers, or None if no discount applies
+    """
+    factor_column = f'Reserved Factor {reserved_instance}'
+    discount_column = f'Reserved Discount {reserved_instance}'
+    
+    if factor_column in df.columns:
+        return df[factor_column].to_numpy(dtype=float)
+    if discount_column in df.columns:
+        return 1 - df[discount_column].fillna(0).to_numpy(dtype=float) / 100
+    return None
+
 def calculate_total_cost(
     pricing_row: pd.Series,
     usage: float,
@@ -154,10 +230,10 @@ def calculate_total_cost(
     
     if reserved_instance == '1yr' and 'Reserved Discount 1yr' in pricing_row:
         discount = pricing_row['Reserved Discount 1yr']
-        final_cost = apply_reserved_discount(base_cost, discount)
+        final_cost = base_cost * pricing_row.get('Reserved Factor 1yr', 1 - discount / 100)
     elif reserved_instance == '3yr' and 'Reserved Discount 3yr' in pricing_row:
         discount = pricing_row['Reserved Discount 3yr']
-        final_cost = apply_reserved_discount(base_cost, discount)
+        final_cost = base_cost * pricing_row.get('Reserved Factor 3yr', 1 - discount / 100)
     
     return {
         'base_cost': base_cost,
@@ -167,6 +243,50 @@ def calculate_total_cost(
         'time_period': time_period
     }
 
+def get_cheapest_services(
+    df: pd.DataFrame,
+    usage_by_service: Dict[str, float],
+    time_period: str = 'month',
+    reserved_instance: str = 'on-demand'
+) -> pd.DataFrame:
+    """
+    Find the lowest cost option for each service.
+    
+    Args:
+        df: DataFrame with pricing data
+        usage_by_service: Mapping of service name to amount of usage
+        time_period: Time period for calculation
+        reserved_instance: Type of instance pricing
+    
+    Returns:
+        DataFrame with the cheapest row per service, in the order of usage_by_service
+    """
+    candidates = df[df['Service'].isin(list(usage_by_service))]
+    
+    # Base cost for every candidate row, scaled to the billing period
+    usage = candidates['Service'].map(usage_by_service).to_numpy(dtype=float)
+    time_scale = _TIME_SCALE.get(time_period, 1.0)
+    
+    final_cost = calculate_costs(
+        usage,
+        candidates['Price Per Unit'].to_numpy(),
+        _reserved_factor(candidates, reserved_instance),
+        time_scale
+    )
+    
+    # Pick the cheapest row per service in one pass over the group codes
+    codes, services = pd.factorize(candidates['Service'])
+    cheapest_rows = cheapest_per_group(codes.astype(np.int64), final_cost, len(services))
+    cheapest_by_service = dict(zip(services, cheapest_rows))
+    positions = [
+        cheapest_by_service[service] for service in usage_by_service
+        if cheapest_by_service.get(service, -1) >= 0
+    ]
+    
+    return candidates[['Provider', 'Service', 'Currency']].iloc[positions].assign(
+        **{'Final Cost': final_cost[positions]}
+    )
+
 def filter_pricing_data(
     df: pd.DataFrame,
     provider: Optional[str] = None,
@@ -189,20 +309,98 @@ def filter_pricing_data(
     Returns:
         Filtered DataFrame
     """
-    filtered_df = df.copy()
+    filters = {
+        'Provider': provider,
+        'Service': service,
+        'Instance Type': instance_type,
+        'Region': region,
+        'Usage Type': usage_type
+    }
     
-    if provider and provider != "All":
-        filtered_df = filtered_df[filtered_df['Provider'] == provider]
-    if service and service != "All":
-        filtered_df = filtered_df[filtered_df['Service'] == service]
-    if instance_type and instance_type != "All":
-        filtered_df = filtered_df[filtered_df['Instance Type'] == instance_type]
-    if region and region != "All":
-        filtered_df = filtered_df[filtered_df['Region'] == region]
-    if usage_type and usage_type != "All":
-        filtered_df = filtered_df[filtered_df['Usage Type'] == usage_type]
+    # Combine all active filters into a single mask so the frame is sliced once.
+    # The filter columns are categoricals, so each comparison is an integer scan;
+    # a sorted MultiIndex is deliberately not used because it would reorder the
+    # rows, and row order drives chart ordering and the simulator's defaults.
+    mask = np.ones(len(df), dtype=bool)
+    for column, value in filters.items():
+        if value and value != "All":
+            mask &= (df[column] == value).to_numpy()
         
-    return filtered_df
+    return df[mask]
+
+@st.cache_data(show_spinner=False)
+def cached_filter_pricing_data(
+    df: pd.DataFrame,
+    provider: Optional[str] = None,
+    usage_type: Optional[str] = None,
+    region: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Filter pricing data by the sidebar selections, cached across Streamlit reruns.
+    
+    Args:
+        df: DataFrame with pricing data
+        provider: Cloud provider name
+        usage_type: Type of usage (storage, compute, etc.)
+        region: Geographic region
+    
+    Returns:
+        Filtered DataFrame
+    """
+    return filter_pricing_data(df, provider=provider, usage_type=usage_type, region=region)
+
+@st.cache_data(show_spinner=False)
+def get_units_by(df: pd.DataFrame, column: str) -> Dict[str, str]:
+    """
+    Map each value of a column to the units of its first pricing row.
+    
+    Args:
+        df: DataFrame with pricing data
+        column: Column to key the mapping by
+    
+    Returns:
+        Dictionary of column value to units, in order of first appearance
+    """
+    first_rows = df.drop_duplicates(column)
+    return dict(zip(first_rows[column], first_rows['Units']))
+
+@st.cache_data(show_spinner=False)
+def get_filter_options(df: pd.DataFrame, column: str) -> List[str]:
+    """
+    Get the selectable options for a filter column.
+    
+    Args:
+        df: DataFrame with pricing data
+        column: Column to collect options from
+    
+    Returns:
+        "All" followed by the sorted unique values of the column
+    """
+    values = df[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Categories are already the distinct values, no need to scan the rows
+        return ["All"] + sorted(values.cat.categories.tolist())
+    return ["All"] + sorted(values.unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def get_regional_variance(df: pd.DataFrame, usage_type: str) -> pd.DataFrame:
+    """
+    Get regional pricing for a service type, cached across Streamlit reruns.
+    
+    Args:
+        df: DataFrame with pricing data
+        usage_type: Type of usage (storage, compute, etc.)
+    
+    Returns:
+        DataFrame sorted by provider and region, with a '% Above Lowest' column
+        giving each price's premium over the provider's cheapest region
+    """
+    regional_data = df[df['Usage Type'] == usage_type].sort_values(['Provider', 'Region'])
+    
+    min_prices = regional_data.groupby('Provider', observed=True)['Price Per Unit'].transform('min')
+    regional_data['% Above Lowest'] = ((regional_data['Price Per Unit'] - min_prices) / min_prices * 100).round(2)
+    
+    return regional_data
 
 def compare_providers(
     df: pd.DataFrame,
@@ -223,39 +421,42 @@ def compare_providers(
         DataFrame with comparison results
     """
     # Filter by service type and region if specified
-    filtered_df = df[df['Usage Type'] == service_type]
+    mask = (df['Usage Type'] == service_type).to_numpy()
     if region and region != "All":
-        filtered_df = filtered_df[filtered_df['Region'] == region]
+        mask &= (df['Region'] == region).to_numpy()
+    filtered_df = df[mask]
     
     if filtered_df.empty:
         return pd.DataFrame()
     
-    # Calculate costs for each service
-    results = []
-    for idx, row in filtered_df.iterrows():
-        on_demand_cost = calculate_cost(usage_amount, row['Price Per Unit'])
-        
-        reserved_1yr_cost = on_demand_cost
-        if 'Reserved Discount 1yr' in row:
-            reserved_1yr_cost = apply_reserved_discount(on_demand_cost, row['Reserved Discount 1yr'])
-            
-        reserved_3yr_cost = on_demand_cost
-        if 'Reserved Discount 3yr' in row:
-            reserved_3yr_cost = apply_reserved_discount(on_demand_cost, row['Reserved Discount 3yr'])
-        
-        results.append({
-            'Provider': row['Provider'],
-            'Service': row['Service'],
-            'Region': row['Region'],
-            'On-Demand Cost': on_demand_cost,
-            '1-Year Reserved Cost': reserved_1yr_cost,
-            '3-Year Reserved Cost': reserved_3yr_cost,
-            'Currency': row['Currency'],
-            'Performance Score': row['Performance Score'] if 'Performance Score' in row else None,
-            'Availability': row['Availability'] if 'Availability' in row else None
-        })
-    
-    return pd.DataFrame(results)
+    # Calculate costs for all services at once on the underlying arrays
+    price = filtered_df['Price Per Unit'].to_numpy()
+    on_demand_cost = calculate_costs(usage_amount, price)
+
+    reserved_1yr_cost = calculate_costs(usage_amount, price, _reserved_factor(filtered_df, '1yr'))
+    reserved_3yr_cost = calculate_costs(usage_amount, price, _reserved_factor(filtered_df, '3yr'))
+
+    # Optional metrics become NaN columns when missing, keeping one numeric array per column
+    missing = np.full(len(filtered_df), np.nan)
+
+    # Labels are precomputed by load_pricing_data; build them for frames loaded any other way
+    if 'Provider_Service' in filtered_df.columns:
+        provider_service = filtered_df['Provider_Service'].array
+    else:
+        provider_service = (filtered_df['Provider'].astype(str) + ' - ' + filtered_df['Service'].astype(str)).to_numpy()
+
+    return pd.DataFrame({
+        'Provider': filtered_df['Provider'].to_numpy(),
+        'Service': filtered_df['Service'].to_numpy(),
+        'Provider_Service': provider_service,
+        'Region': filtered_df['Region'].to_numpy(),
+        'On-Demand Cost': on_demand_cost,
+        '1-Year Reserved Cost': reserved_1yr_cost,
+        '3-Year Reserved Cost': reserved_3yr_cost,
+        'Currency': filtered_df['Currency'].to_numpy(),
+        'Performance Score': filtered_df['Performance Score'].to_numpy() if 'Performance Score' in filtered_df.columns else missing,
+        'Availability': filtered_df['Availability'].to_numpy() if 'Availability' in filtered_df.columns else missing
+    })
 
 def get_performance_ratio(df: pd.DataFrame, usage_amount: float) -> pd.DataFrame:
     """
@@ -271,24 +472,21 @@ def get_performance_ratio(df: pd.DataFrame, usage_amount: float) -> pd.DataFrame
     if 'Performance Score' not in df.columns:
         return pd.DataFrame()
     
-    results = []
-    for idx, row in df.iterrows():
-        cost = calculate_cost(usage_amount, row['Price Per Unit'])
-        
-        # Calculate price-to-performance ratio (lower is better)
-        if row['Performance Score'] > 0:
-            performance_ratio = cost / row['Performance Score']
-        else:
-            performance_ratio = float('inf')
-            
-        results.append({
-            'Provider': row['Provider'],
-            'Service': row['Service'],
-            'Region': row['Region'],
-            'Cost': cost,
-            'Performance Score': row['Performance Score'],
-            'Price/Performance Ratio': performance_ratio,
-            'Currency': row['Currency']
-        })
-    
-    return pd.DataFrame(results).sort_values('Price/Performance Ratio')
\ No newline at end of file
+    cost = float(usage_amount) * df['Price Per Unit'].to_numpy(dtype=float)
+    score = df['Performance Score'].to_numpy(dtype=float)
+
+    # Calculate price-to-performance ratio (lower is better)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        performance_ratio = np.where(score > 0, cost / score, np.inf)
+
+    results = pd.DataFrame({
+        'Provider': df['Provider'].to_numpy(),
+        'Service': df['Service'].to_numpy(),
+        'Region': df['Region'].to_numpy(),
+        'Cost': cost,
+        'Performance Score': df['Performance Score'].to_numpy(),
+        'Price/Performance Ratio': performance_ratio,
+        'Currency': df['Currency'].to_numpy()
+    })
+
+    return results.sort_values('Price/Performance Ratio')
\ No newline at end of file
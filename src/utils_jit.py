@@ -0,0 +1,113 @@
+import numpy as np
+from typing import Optional, Union
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; fall back to plain NumPy when it is not installed
+    njit = None
+
+if njit is not None:
+    # Compiled serially: pricing tables are far too small to amortise a
+    # parallel thread pool, which also hangs interpreter shutdown under TBB
+    # when first used from a Streamlit script thread.
+    @njit(cache=True)
+    def cost_kernel(usage, price, factor, time_scale, out):
+        """
+        Compute discounted costs elementwise in a single fused pass.
+
+        Args:
+            usage: Array with the amount of usage per row
+            price: Array with the price per unit per row
+            factor: Array with the reserved pricing cost multiplier per row
+            time_scale: Multiplier for the billing period
+            out: Preallocated output array
+        """
+        for i in range(price.size):
+            out[i] = usage[i] * price[i] * time_scale * factor[i]
+
+    @njit(cache=True)
+    def cheapest_per_group(codes, cost, n_groups):
+        """
+        Find the position of the cheapest row in each group in a single pass.
+
+        Args:
+            codes: Array with the group code per row, -1 for no group
+            cost: Array with the cost per row
+            n_groups: Number of groups
+
+        Returns:
+            Array with the position of the cheapest row per group, -1 if none
+        """
+        best = np.full(n_groups, np.inf)
+        best_idx = np.full(n_groups, -1, np.int64)
+        for i in range(codes.size):
+            g = codes[i]
+            if g >= 0 and cost[i] < best[g]:
+                best[g] = cost[i]
+                best_idx[g] = i
+        return best_idx
+else:
+    def cost_kernel(usage, price, factor, time_scale, out):
+        """
+        Compute discounted costs elementwise with NumPy.
+
+        Args:
+            usage: Array with the amount of usage per row
+            price: Array with the price per unit per row
+            factor: Array with the reserved pricing cost multiplier per row
+            time_scale: Multiplier for the billing period
+            out: Preallocated output array
+        """
+        np.multiply(usage, price, out=out)
+        out *= time_scale
+        out *= factor
+
+    def cheapest_per_group(codes, cost, n_groups):
+        """
+        Find the position of the cheapest row in each group with NumPy.
+
+        Args:
+            codes: Array with the group code per row, -1 for no group
+            cost: Array with the cost per row
+            n_groups: Number of groups
+
+        Returns:
+            Array with the position of the cheapest row per group, -1 if none
+        """
+        best_idx = np.full(n_groups, -1, np.int64)
+        candidates = np.flatnonzero((codes >= 0) & (cost < np.inf))
+        # Stable sort by group then cost, so the first row wins ties
+        ordered = candidates[np.lexsort((cost[candidates], codes[candidates]))]
+        groups, first = np.unique(codes[ordered], return_index=True)
+        best_idx[groups] = ordered[first]
+        return best_idx
+
+def calculate_costs(
+    usage: Union[float, np.ndarray],
+    price: np.ndarray,
+    factor: Optional[np.ndarray] = None,
+    time_scale: float = 1.0
+) -> np.ndarray:
+    """
+    Calculate discounted costs for many pricing rows at once.
+
+    Args:
+        usage: Amount of usage, either a single value or one per row
+        price: Price per unit for each row
+        factor: Reserved pricing cost multiplier for each row, or None for no discount
+        time_scale: Multiplier for the billing period
+
+    Returns:
+        Array of discounted costs
+    """
+    price = np.ascontiguousarray(price, dtype=np.float64)
+    usage = np.ascontiguousarray(np.broadcast_to(np.asarray(usage, dtype=np.float64), price.shape))
+    if factor is None:
+        factor = np.ones_like(price)
+    else:
+        factor = np.ascontiguousarray(factor, dtype=np.float64)
+
+    out = np.empty_like(price)
+    cost_kernel(usage, price, factor, float(time_scale), out)
+    return out
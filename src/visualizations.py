@@ -1,12 +1,101 @@
+import functools
+import json
+from operator import itemgetter
 import pandas as pd
+import numpy as np
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import altair as alt
 from typing import List, Dict, Optional, Union, Tuple
+from pandas.io.formats.style import Styler
 
-def plot_cost_comparison(comparison_df: pd.DataFrame, cost_column: str = 'On-Demand Cost') -> Optional[go.Figure]:
+def _dataframe_hasher(columns: Optional[Tuple[str, ...]] = None):
+    """
+    Build a DataFrame hash function for st.cache_data using pandas' vectorized row hashing.
+    
+    Args:
+        columns: Columns a plotting function reads, or None to hash every column
+    
+    Returns:
+        Function returning bytes that identify a DataFrame's column names and the
+        contents of the hashed columns
+    """
+    def hash_dataframe(df: pd.DataFrame) -> bytes:
+        # The index is never plotted, and the full column list still keys the presence checks
+        data = df if columns is None else df[[c for c in columns if c in df.columns]]
+        key = repr((tuple(df.columns), len(df.index))).encode()
+        if len(data.columns) == 0:
+            return key
+        return key + pd.util.hash_pandas_object(data, index=False).values.tobytes()
+    
+    return hash_dataframe
+
+def _first(df: pd.DataFrame, column: str, default: str = '') -> str:
+    """
+    Get the first value of a column, used for chart labels.
+    
+    Args:
+        df: DataFrame to read from
+        column: Column name to read
+        default: Value to use when the column is missing or the DataFrame is empty
+    
+    Returns:
+        First value in the column, or the default
+    """
+    if column not in df.columns or len(df.index) == 0:
+        return default
+    return df[column].iat[0]
+
+def _provider_service(df: pd.DataFrame) -> np.ndarray:
+    """
+    Get the 'Provider - Service' label for each row.
+    
+    Args:
+        df: DataFrame with Provider and Service columns
+    
+    Returns:
+        Array of labels, taken from the precomputed Provider_Service column when present
+    """
+    if 'Provider_Service' in df.columns:
+        return df['Provider_Service'].to_numpy()
+    return (df['Provider'].astype(str) + ' - ' + df['Service'].astype(str)).to_numpy()
+
+def _cache_figure(columns: Optional[Tuple[str, ...]] = None):
+    """
+    Cache a plotting function's figure across Streamlit reruns.
+    
+    Figures are rebuilt only when the data behind them changes, and only the most
+    recent ones are kept per plotting function. They are stored serialized to JSON
+    so a cache hit skips unpickling and re-serializing a go.Figure. Callers get a
+    plain dict that st.plotly_chart accepts directly.
+    
+    Args:
+        columns: DataFrame columns the plotting function reads, or None if it may read any
+    
+    Returns:
+        Decorator turning a plotting function into a cached one returning the
+        figure as a dict, or None
+    """
+    def decorator(func):
+        # Keys change with every usage amount typed in, so keep only the most recent figures
+        @st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: _dataframe_hasher(columns)})
+        @functools.wraps(func)
+        def serialized(*args, **kwargs):
+            fig = func(*args, **kwargs)
+            return None if fig is None else fig.to_json()
+        
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            spec = serialized(*args, **kwargs)
+            return None if spec is None else json.loads(spec)
+        
+        return cached
+    
+    return decorator
+
+# cost_column is chosen by the caller, so any column may be read
+@_cache_figure()
+def plot_cost_comparison(comparison_df: pd.DataFrame, cost_column: str = 'On-Demand Cost') -> Optional[Dict]:
     """
     Create a bar chart comparing costs across providers.
     
@@ -15,37 +104,49 @@ def plot_cost_comparison(comparison_df: pd.DataFrame, cost_column: str = 'On-Dem
         cost_column: Column name with cost data to visualize
     
     Returns:
-        Plotly figure object or None if DataFrame is empty
+        Plotly figure as a dict or None if DataFrame is empty
     """
-    if comparison_df.empty:
+    if len(comparison_df.index) == 0:
         return None
     
-    # Create identifiers combining provider and service
-    comparison_df['Provider_Service'] = comparison_df['Provider'] + ' - ' + comparison_df['Service']
-    
-    fig = px.bar(
-        comparison_df,
-        x='Provider_Service',
-        y=cost_column,
-        color='Provider',
-        labels={
-            'Provider_Service': 'Provider - Service',
-            cost_column: f'Cost ({comparison_df["Currency"].iloc[0]})'
-        },
-        title=f'Cloud Service {cost_column} Comparison',
-        hover_data=['Region', 'Performance Score', 'Availability']
-    )
-    
-    fig.update_layout(
-        xaxis_title='Provider - Service',
-        yaxis_title=f'Cost ({comparison_df["Currency"].iloc[0]})',
-        legend_title='Provider',
-        height=500
+    currency = _first(comparison_df, 'Currency', 'USD')
+    cost_label = f'Cost ({currency})'
+    
+    # Build one bar trace per provider directly rather than through Plotly Express. Bar
+    # heights are sent as float32, which is ample for display and halves the payload.
+    traces = [
+        go.Bar(
+            name=str(provider),
+            x=_provider_service(provider_df),
+            y=provider_df[cost_column].to_numpy(dtype=np.float32),
+            customdata=provider_df[['Region', 'Performance Score', 'Availability']].to_numpy(),
+            hovertemplate=(
+                f'Provider={provider}<br>Provider - Service=%{{x}}<br>{cost_label}=%{{y}}<br>'
+                'Region=%{customdata[0]}<br>Performance Score=%{customdata[1]}<br>'
+                'Availability=%{customdata[2]}<extra></extra>'
+            ),
+            showlegend=True
+        )
+        for provider, provider_df in comparison_df.groupby('Provider', sort=False, observed=True)
+    ]
+    
+    # Set the layout at construction so the figure is validated once
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f'Cloud Service {cost_column} Comparison',
+            xaxis_title='Provider - Service',
+            yaxis_title=cost_label,
+            legend_title='Provider',
+            barmode='relative',
+            height=500
+        )
     )
     
     return fig
 
-def plot_price_performance_ratio(performance_df: pd.DataFrame) -> Optional[go.Figure]:
+@_cache_figure(columns=('Provider', 'Service', 'Cost', 'Performance Score', 'Price/Performance Ratio', 'Currency'))
+def plot_price_performance_ratio(performance_df: pd.DataFrame) -> Optional[Dict]:
     """
     Create a scatter plot showing price-to-performance ratio.
     
@@ -53,13 +154,16 @@ def plot_price_performance_ratio(performance_df: pd.DataFrame) -> Optional[go.Fi
         performance_df: DataFrame with performance metrics
     
     Returns:
-        Plotly figure object or None if DataFrame is empty
+        Plotly figure as a dict or None if DataFrame is empty
     """
-    if performance_df.empty or 'Performance Score' not in performance_df.columns:
+    if len(performance_df.index) == 0 or 'Performance Score' not in performance_df.columns:
         return None
     
+    currency = _first(performance_df, 'Currency', 'USD')
+    
+    # Plot positions as float32 to halve the serialized arrays; the ratio sizing keeps full precision
     fig = px.scatter(
-        performance_df,
+        performance_df.astype({'Performance Score': np.float32, 'Cost': np.float32}),
         x='Performance Score',
         y='Cost',
         color='Provider',
@@ -68,34 +172,37 @@ def plot_price_performance_ratio(performance_df: pd.DataFrame) -> Optional[go.Fi
         text='Service',
         labels={
             'Performance Score': 'Performance Score (higher is better)',
-            'Cost': f'Cost ({performance_df["Currency"].iloc[0]})',
+            'Cost': f'Cost ({currency})',
             'Price/Performance Ratio': 'Price/Performance (lower is better)'
         },
-        title='Price vs Performance Comparison'
+        title='Price vs Performance Comparison',
+        height=600,
+        render_mode='webgl'
     )
     
+    # Outlined markers can push WebGL scatters back onto the SVG path in some Plotly versions
+    fig.update_traces(marker_line_width=0)
+    
     # Add diagonal lines representing constant price/performance ratios
     max_perf = performance_df['Performance Score'].max() * 1.1
-    max_cost = performance_df['Cost'].max() * 1.1
     
-    ratio_lines = [0.1, 0.2, 0.3, 0.4, 0.5]
+    # Draw all ratio lines as one polyline, with None breaking it between segments
+    ratio_lines = [0.1, 0.2, 0.3]
+    xs, ys = [], []
     for ratio in ratio_lines:
-        fig.add_trace(
-            go.Scatter(
-                x=[0, max_perf],
-                y=[0, max_perf * ratio],
-                mode='lines',
-                line=dict(color='gray', width=1, dash='dot'),
-                name=f'Ratio = {ratio}',
-                hoverinfo='none',
-                showlegend=False
-            )
+        xs.extend([0, max_perf, None])
+        ys.extend([0, max_perf * ratio, None])
+    
+    fig.add_trace(
+        go.Scattergl(
+            x=xs,
+            y=ys,
+            mode='lines',
+            line=dict(color='gray', width=1, dash='dot'),
+            name='Price/Performance Ratios',
+            hoverinfo='skip',
+            showlegend=False
         )
-    
-    fig.update_layout(
-        height=600,
-        xaxis_title='Performance Score (higher is better)',
-        yaxis_title=f'Cost ({performance_df["Currency"].iloc[0]})'
     )
     
     # Add annotations for better ratio lines explanation
@@ -111,7 +218,8 @@ def plot_price_performance_ratio(performance_df: pd.DataFrame) -> Optional[go.Fi
     
     return fig
 
-def plot_regional_pricing(df: pd.DataFrame, service_type: str) -> Optional[go.Figure]:
+@_cache_figure(columns=('Usage Type', 'Region', 'Price Per Unit', 'Provider', 'Units', 'Currency'))
+def plot_regional_pricing(df: pd.DataFrame, service_type: str) -> Optional[Dict]:
     """
     Create a choropleth map showing pricing by region.
     
@@ -120,36 +228,46 @@ def plot_regional_pricing(df: pd.DataFrame, service_type: str) -> Optional[go.Fi
         service_type: Type of service to visualize
     
     Returns:
-        Plotly figure object or None if insufficient data
+        Plotly figure as a dict or None if insufficient data
     """
     # For now, simplify to a bar chart by region since we don't have precise geo coordinates
-    filtered_df = df[df['Usage Type'] == service_type].copy()
-    
-    if filtered_df.empty:
+    # Only pull the columns the chart reads, rather than copying every matching row in full
+    mask = (df['Usage Type'] == service_type).to_numpy()
+    if not mask.any():
         return None
-    
-    fig = px.bar(
-        filtered_df,
-        x='Region',
-        y='Price Per Unit',
-        color='Provider',
-        barmode='group',
-        labels={
-            'Price Per Unit': f'Price Per {filtered_df["Units"].iloc[0]} ({filtered_df["Currency"].iloc[0]})',
-            'Region': 'Region'
-        },
-        title=f'Regional Pricing Comparison for {service_type}'
-    )
-    
-    fig.update_layout(
-        xaxis_title='Region',
-        yaxis_title=f'Price Per {filtered_df["Units"].iloc[0]} ({filtered_df["Currency"].iloc[0]})',
-        legend_title='Provider'
+    columns = [c for c in ('Region', 'Price Per Unit', 'Provider', 'Units', 'Currency') if c in df.columns]
+    filtered_df = df.loc[mask, columns]
+    
+    units = _first(filtered_df, 'Units', 'Unit')
+    currency = _first(filtered_df, 'Currency', 'USD')
+    price_label = f'Price Per {units} ({currency})'
+    
+    traces = [
+        go.Bar(
+            name=str(provider),
+            x=provider_df['Region'].to_numpy(),
+            y=provider_df['Price Per Unit'].to_numpy(dtype=np.float32),
+            hovertemplate=f'Provider={provider}<br>Region=%{{x}}<br>{price_label}=%{{y}}<extra></extra>',
+            showlegend=True
+        )
+        for provider, provider_df in filtered_df.groupby('Provider', sort=False, observed=True)
+    ]
+    
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title=f'Regional Pricing Comparison for {service_type}',
+            xaxis_title='Region',
+            yaxis_title=price_label,
+            legend_title='Provider',
+            barmode='group'
+        )
     )
     
     return fig
 
-def plot_reserved_savings(comparison_df: pd.DataFrame) -> Optional[go.Figure]:
+@_cache_figure(columns=('Provider', 'Service', 'Provider_Service', 'On-Demand Cost', '1-Year Reserved Cost', '3-Year Reserved Cost', 'Currency'))
+def plot_reserved_savings(comparison_df: pd.DataFrame) -> Optional[Dict]:
     """
     Create a chart showing savings from reserved instances.
     
@@ -157,72 +275,51 @@ def plot_reserved_savings(comparison_df: pd.DataFrame) -> Optional[go.Figure]:
         comparison_df: DataFrame with comparison data including reserved pricing
     
     Returns:
-        Plotly figure object or None if DataFrame is empty
+        Plotly figure as a dict or None if DataFrame is empty
     """
-    if comparison_df.empty or 'On-Demand Cost' not in comparison_df.columns:
+    if len(comparison_df.index) == 0 or 'On-Demand Cost' not in comparison_df.columns:
         return None
     
-    # Create a new DataFrame for visualization
-    plot_data = []
-    
-    for _, row in comparison_df.iterrows():
-        provider_service = f"{row['Provider']} - {row['Service']}"
-        
-        # Add on-demand data
-        plot_data.append({
-            'Provider_Service': provider_service,
-            'Pricing Type': 'On-Demand',
-            'Cost': row['On-Demand Cost'],
-            'Provider': row['Provider'],
-            'Currency': row['Currency']
-        })
-        
-        # Add 1-year reserved data if available
-        if '1-Year Reserved Cost' in row:
-            plot_data.append({
-                'Provider_Service': provider_service,
-                'Pricing Type': '1-Year Reserved',
-                'Cost': row['1-Year Reserved Cost'],
-                'Provider': row['Provider'],
-                'Currency': row['Currency']
-            })
-            
-        # Add 3-year reserved data if available
-        if '3-Year Reserved Cost' in row:
-            plot_data.append({
-                'Provider_Service': provider_service,
-                'Pricing Type': '3-Year Reserved',
-                'Cost': row['3-Year Reserved Cost'],
-                'Provider': row['Provider'],
-                'Currency': row['Currency']
-            })
-    
-    plot_df = pd.DataFrame(plot_data)
-    
-    # Create the visualization
-    fig = px.bar(
-        plot_df,
-        x='Provider_Service',
-        y='Cost',
-        color='Pricing Type',
-        barmode='group',
-        labels={
-            'Provider_Service': 'Provider - Service',
-            'Cost': f'Cost ({plot_df["Currency"].iloc[0]})',
-            'Pricing Type': 'Pricing Type'
-        },
-        title='On-Demand vs Reserved Instance Pricing Comparison'
-    )
-    
-    fig.update_layout(
-        xaxis_title='Provider - Service',
-        yaxis_title=f'Cost ({plot_df["Currency"].iloc[0]})',
-        legend_title='Pricing Type'
+    pricing_types = {
+        'On-Demand Cost': 'On-Demand',
+        '1-Year Reserved Cost': '1-Year Reserved',
+        '3-Year Reserved Cost': '3-Year Reserved'
+    }
+    provider_service = _provider_service(comparison_df)
+    currency = _first(comparison_df, 'Currency', 'USD')
+    cost_label = f'Cost ({currency})'
+    
+    # Each pricing type is already its own column, so it maps straight onto one bar trace
+    traces = [
+        go.Bar(
+            name=pricing_type,
+            x=provider_service,
+            y=comparison_df[cost_column].to_numpy(dtype=np.float32),
+            hovertemplate=(
+                f'Pricing Type={pricing_type}<br>Provider - Service=%{{x}}<br>'
+                f'{cost_label}=%{{y}}<extra></extra>'
+            ),
+            showlegend=True
+        )
+        for cost_column, pricing_type in pricing_types.items()
+        if cost_column in comparison_df.columns
+    ]
+    
+    fig = go.Figure(
+        data=traces,
+        layout=dict(
+            title='On-Demand vs Reserved Instance Pricing Comparison',
+            xaxis_title='Provider - Service',
+            yaxis_title=cost_label,
+            legend_title='Pricing Type',
+            barmode='group'
+        )
     )
     
     return fig
 
-def plot_cost_breakdown(costs_list: List[Dict[str, Union[str, float]]]) -> Optional[go.Figure]:
+@_cache_figure()
+def plot_cost_breakdown(costs_list: List[Dict[str, Union[str, float]]]) -> Optional[Dict]:
     """
     Create a pie chart showing cost breakdown.
     
@@ -230,23 +327,45 @@ def plot_cost_breakdown(costs_list: List[Dict[str, Union[str, float]]]) -> Optio
         costs_list: List of dictionaries with cost components
     
     Returns:
-        Plotly figure object or None if insufficient data
+        Plotly figure as a dict or None if insufficient data
     """
     if not costs_list:
         return None
     
     # Extract relevant data
-    labels = [item['name'] for item in costs_list]
-    values = [item['cost'] for item in costs_list]
-    
-    fig = px.pie(
-        names=labels,
-        values=values,
-        title='Cost Breakdown',
-        hole=0.4
+    labels = list(map(itemgetter('name'), costs_list))
+    values = np.fromiter(map(itemgetter('cost'), costs_list), dtype=np.float64, count=len(costs_list))
+    
+    fig = go.Figure(
+        data=go.Pie(
+            labels=labels,
+            values=values,
+            hole=0.4,
+            textposition='inside',
+            textinfo='percent+label',
+            hovertemplate='label=%{label}<br>value=%{value}<extra></extra>'
+        ),
+        layout=dict(title='Cost Breakdown', uniformtext_minsize=12, uniformtext_mode='hide')
     )
     
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(uniformtext_minsize=12, uniformtext_mode='hide')
+    return fig
+
+def highlight_min(df: pd.DataFrame, column: str, color: str = 'lightgreen') -> Styler:
+    """
+    Style a DataFrame so the lowest value in a column is highlighted.
+    
+    Args:
+        df: DataFrame to display
+        column: Column whose minimum should be highlighted
+        color: Background color for the highlighted cell
+    
+    Returns:
+        Styler with the minimum cell highlighted
+    """
+    # Work out the cell styles once with NumPy rather than through Styler's generic highlighter
+    values = df[column].to_numpy(dtype=float)
+    styles = np.full(len(values), '', dtype=object)
+    if len(values) and not np.isnan(values).all():
+        styles[values == np.nanmin(values)] = f'background-color: {color}'
     
-    return fig
\ No newline at end of file
+    return df.style.apply(lambda _: styles, subset=[column])